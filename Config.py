@@ -4,12 +4,21 @@ Configuration settings for the Dynasty Tracker Discord Bot.
 import os
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables once, even if this module is imported again
+if not os.getenv('_DOTENV_LOADED'):
+    load_dotenv()
+    os.environ['_DOTENV_LOADED'] = '1'
+
+# Discord bot token
+TOKEN = os.getenv('DISCORD_TOKEN')
 
 # Bot command prefix
 PREFIX = os.getenv('COMMAND_PREFIX', '$')
 
+# Host and port for the keep-alive web server
+KEEP_ALIVE_HOST = '0.0.0.0'
+KEEP_ALIVE_PORT = 8080
+
 # Initial cogs/extensions to load
 INITIAL_EXTENSIONS = [
     'cogs.dynasty_tracker',
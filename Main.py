@@ -2,28 +2,11 @@
 Main entry point for the Dynasty Tracker Discord Bot.
 This file initializes and runs the bot.
 """
-import os
 import logging
 import discord
-from flask import Flask
-from threading import Thread
-
-app = Flask(__name__)
-
-@app.route("/")
-def home():
-    return "Bot is running!"
-
-def run():
-    app.run(host="0.0.0.0", port=8080)
-
-def keep_alive():
-    server = Thread(target=run)
-    server.start()
-
-from dotenv import load_dotenv
 
 from bot import DynastyBot
+from config import TOKEN
 
 # Set up logging
 logging.basicConfig(
@@ -32,13 +15,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger('dynasty_bot')
 
-# Load environment variables
-load_dotenv()
-
 def main():
     """Main function to start the bot"""
-    # Get the bot token from environment variables
-    token = os.getenv('DISCORD_TOKEN')
+    # Get the bot token loaded from the environment by config
+    token = TOKEN
     
     if not token:
         logger.error("No Discord token found. Please add it to your .env file.")
@@ -48,7 +28,6 @@ def main():
     try:
         bot = DynastyBot()
         logger.info("Starting Dynasty Tracker Bot...")
-        keep_alive()
         bot.run(token)
     except discord.errors.PrivilegedIntentsRequired:
         logger.error("ERROR: Privileged Intents are required but not enabled in the Discord Developer Portal.")
@@ -64,15 +43,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
-from threading import Thread
-
-# Function to run Flask server in a separate thread
-def run_flask():
-    keep_alive()
-
-# Start Flask in a new thread, so it doesn’t block the bot
-Thread(target=run_flask).start()
-
-# Start the Discord bot
-bot.run(TOKEN)
@@ -2,14 +2,20 @@
 The main bot class for the Dynasty Tracker Discord Bot.
 """
 import os
+import asyncio
 import discord
 from discord.ext import commands
+from aiohttp import web
 import logging
 
-from config import PREFIX, INITIAL_EXTENSIONS
+from config import PREFIX, INITIAL_EXTENSIONS, USERS, KEEP_ALIVE_HOST, KEEP_ALIVE_PORT
+from utils.storage import DynastyStorage
 
 logger = logging.getLogger('dynasty_bot')
 
+# Uppercased tracked user names used as member index keys
+USERS_UPPER = tuple(user.upper() for user in USERS)
+
 class DynastyBot(commands.Bot):
     """
     Custom Discord Bot class for tracking dynasty advancement status.
@@ -33,19 +39,106 @@ class DynastyBot(commands.Bot):
             basic_intents = discord.Intents.default()
             super().__init__(command_prefix=PREFIX, intents=basic_intents)
         
+        # Maps each uppercased tracked user name to its guild member
+        self.member_index: dict[str, discord.Member] = {}
+        self.web_runner = None
+        
+        # Shared dynasty storage used by all cogs, created in setup_hook
+        self.storage = None
+        
         # Extensions will be loaded in setup_hook
     
     async def setup_hook(self):
         """Setup hook for the bot"""
+        # Serve the keep-alive route on the bot's own event loop
+        await self.start_keep_alive()
+        
+        # Load dynasty data and start saving it in the background
+        self.storage = DynastyStorage()
+        self.storage.start_writer(self.loop)
+        
         # Load extensions during setup
         await self.load_extensions()
+    
+    async def start_keep_alive(self):
+        """Start the keep-alive web server used by uptime pings"""
+        app = web.Application()
+        app.router.add_get("/", self._handle_keep_alive)
+        self.web_runner = web.AppRunner(app)
+        await self.web_runner.setup()
+        try:
+            await web.TCPSite(self.web_runner, KEEP_ALIVE_HOST, KEEP_ALIVE_PORT).start()
+        except OSError as e:
+            # The bot can run without the keep-alive server, so don't stop startup
+            logger.warning(f"Could not start keep-alive server on port {KEEP_ALIVE_PORT}: {e}")
+            return
+        logger.info(f"Keep-alive server listening on port {KEEP_ALIVE_PORT}")
+    
+    async def _handle_keep_alive(self, request):
+        """Respond to keep-alive pings"""
+        return web.Response(text="Bot is running!")
+    
+    async def close(self):
+        """Shut down the keep-alive server along with the bot"""
+        if self.web_runner is not None:
+            await self.web_runner.cleanup()
+        await super().close()
         
     async def on_ready(self):
         """Event triggered when the bot is ready"""
         logger.info(f"Logged in as {self.user} (ID: {self.user.id})")
         logger.info(f"Connected to {len(self.guilds)} guilds")
+        self.build_member_index()
         await self.change_presence(activity=discord.Game(name=f"{PREFIX}help"))
     
+    async def on_guild_available(self, guild):
+        """Event triggered when a guild becomes available"""
+        for member in guild.members:
+            self._index_member(member)
+    
+    async def on_guild_join(self, guild):
+        """Event triggered when the bot joins a new guild"""
+        for member in guild.members:
+            self._index_member(member)
+    
+    async def on_guild_remove(self, guild):
+        """Event triggered when the bot leaves a guild"""
+        self.build_member_index()
+    
+    async def on_member_join(self, member):
+        """Event triggered when a member joins a guild"""
+        self._index_member(member)
+    
+    async def on_member_remove(self, member):
+        """Event triggered when a member leaves a guild"""
+        if member in self.member_index.values():
+            self.build_member_index()
+    
+    async def on_member_update(self, before, after):
+        """Event triggered when a member is updated"""
+        if before.name != after.name:
+            self.build_member_index()
+    
+    async def on_user_update(self, before, after):
+        """Event triggered when a user changes their profile"""
+        if before.name != after.name:
+            self.build_member_index()
+    
+    def build_member_index(self):
+        """Rebuild the tracked user to member index from all guilds"""
+        self.member_index = {}
+        for guild in self.guilds:
+            for member in guild.members:
+                self._index_member(member)
+        logger.info(f"Indexed {len(self.member_index)} of {len(USERS_UPPER)} tracked users")
+    
+    def _index_member(self, member):
+        """Add a member to the index if their name matches a tracked user"""
+        name = member.name.upper()
+        for user_upper in USERS_UPPER:
+            if user_upper in name and user_upper not in self.member_index:
+                self.member_index[user_upper] = member
+    
     async def on_command_error(self, ctx, error):
         """Global error handler for command errors"""
         if isinstance(error, commands.CommandNotFound):
@@ -64,9 +157,13 @@ class DynastyBot(commands.Bot):
     
     async def load_extensions(self):
         """Load all extension cogs"""
-        for extension in INITIAL_EXTENSIONS:
-            try:
-                await self.load_extension(extension)
+        results = await asyncio.gather(
+            *(self.load_extension(extension) for extension in INITIAL_EXTENSIONS),
+            return_exceptions=True
+        )
+        
+        for extension, result in zip(INITIAL_EXTENSIONS, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to load extension {extension}: {result}")
+            else:
                 logger.info(f"Loaded extension: {extension}")
-            except Exception as e:
-                logger.error(f"Failed to load extension {extension}: {e}")
@@ -7,20 +7,30 @@ import discord
 from discord.ext import commands
 import logging
 import asyncio
+import re
 
 from config import DYNASTIES, USERS
-from utils.storage import DynastyStorage
-from utils.embeds import create_status_embed, create_success_embed, create_error_embed
+from utils.embeds import create_status_embed, create_success_embed, create_error_embed, create_reminder_embed
 
 logger = logging.getLogger('dynasty_bot.dynasty_tracker')
 
+# Uppercased lookup tables, computed once instead of on every message
+_USR_UP = [(user, user.upper()) for user in USERS]
+
+# Matches "<DYNASTY> READY" or "READY <DYNASTY>" in any letter case
+_DYN_ALT = "|".join(re.escape(dynasty.upper()) for dynasty in DYNASTIES)
+_READY_RE = re.compile(rf"\b(?:({_DYN_ALT})\s+READY|READY\s+({_DYN_ALT}))\b", re.IGNORECASE)
+
+# Ready messages are short, so longer messages are skipped without scanning
+_MAX_READY_LENGTH = 128
+
 class DynastyTracker(commands.Cog):
     """
     A cog for tracking dynasty advancement status.
     """
     def __init__(self, bot):
         self.bot = bot
-        self.storage = DynastyStorage()
+        self.storage = bot.storage
     
     @commands.Cog.listener()
     async def on_message(self, message):
@@ -33,25 +43,27 @@ class DynastyTracker(commands.Cog):
         if not message.guild:
             return
         
-        # Check if the message might be a "ready" message
-        content = message.content.upper()
-        
-        for dynasty in DYNASTIES:
-            # Look for messages like "ADHNN READY" or "READY ADHNN"
-            if dynasty in content and "READY" in content:
-                user = message.author.name
-                logger.info(f"Ready message detected from {user} for {dynasty}")
-                
-                # Check if the user is one of the tracked users by simple partial matching
-                matched = False
-                for tracked_user in USERS:
-                    if tracked_user.upper() in user.upper():
-                        await self.mark_ready(message, tracked_user, dynasty)
-                        matched = True
-                        break
-                
-                if not matched:
-                    logger.warning(f"User not matched: {user} tried to mark ready for {dynasty}")
+        # Check if the message is a "ready" message like "ADHNN READY" or "READY ADHNN"
+        content = message.content
+        if len(content) > _MAX_READY_LENGTH:
+            return
+        
+        match = _READY_RE.search(content)
+        if not match:
+            return
+        
+        dynasty = (match.group(1) or match.group(2)).upper()
+        user = message.author.name
+        user_upper = user.upper()
+        logger.info("Ready message detected from %s for %s", user, dynasty)
+        
+        # Check if the user is one of the tracked users by simple partial matching
+        for tracked_user, tracked_upper in _USR_UP:
+            if tracked_upper in user_upper:
+                await self.mark_ready(message, tracked_user, dynasty)
+                return
+        
+        logger.warning("User not matched: %s tried to mark ready for %s", user, dynasty)
     
     async def mark_ready(self, message, user, dynasty):
         """Mark a user as ready for a specific dynasty and check if all users are ready."""
@@ -64,26 +76,30 @@ class DynastyTracker(commands.Cog):
             description=f"🔥 {user} is now ready to advance in {dynasty}! 🔥"
         )
         
-        # Send confirmation and delete the original message
-        await message.channel.send(embed=embed)
-        try:
-            await message.delete()
-        except discord.errors.Forbidden:
+        # Send confirmation and delete the original message concurrently
+        send_result, delete_result = await asyncio.gather(
+            message.channel.send(embed=embed),
+            message.delete(),
+            return_exceptions=True
+        )
+        if isinstance(send_result, Exception):
+            logger.error("Could not send ready confirmation: %s", send_result)
+        if isinstance(delete_result, discord.errors.Forbidden):
             logger.warning("Could not delete message: Missing permissions")
-        except discord.errors.NotFound:
+        elif isinstance(delete_result, discord.errors.NotFound):
             logger.warning("Could not delete message: Message not found")
+        elif isinstance(delete_result, Exception):
+            logger.error("Could not delete message: %s", delete_result)
         
         # Check if all users are ready for this dynasty
-        all_ready = all(self.storage.is_ready(user, dynasty) for user in USERS)
-        if all_ready:
+        if self.storage.all_ready(dynasty):
             # Everyone is ready, reset the dynasty and notify
             await self.auto_reset_dynasty(message.channel, dynasty)
     
     async def auto_reset_dynasty(self, channel, dynasty):
         """Reset a dynasty and notify everyone that it's time to advance."""
         # Reset the dynasty
-        for user in USERS:
-            self.storage.set_ready(user, dynasty, False)
+        self.storage.reset_dynasty(dynasty)
         
         # Create the notification embed
         embed = create_success_embed(
@@ -93,14 +109,12 @@ class DynastyTracker(commands.Cog):
         
         # Add mentions for all users
         mentions = ""
-        for user_name in USERS:
-            # Find the user in the guild
-            for guild in self.bot.guilds:
-                member = discord.utils.find(lambda m: user_name.upper() in m.name.upper(), guild.members)
-                if member:
-                    mentions += f"{member.mention} "
-                    logger.info(f"Found member {member.name} for user {user_name}")
-                    break
+        for user_name, user_upper in _USR_UP:
+            # Look up the user in the bot's member index
+            member = self.bot.member_index.get(user_upper)
+            if member:
+                mentions += f"{member.mention} "
+                logger.info("Found member %s for user %s", member.name, user_name)
         
         # Send the notification with mentions
         await channel.send(content=mentions, embed=embed)
@@ -170,30 +184,19 @@ class DynastyTracker(commands.Cog):
             await ctx.send(embed=embed)
             return
         
-        # Create a notification message
-        embed = discord.Embed(
-            title="Dynasty Advancement Reminder",
-            description="The following users still need to mark as ready:",
-            color=discord.Color.gold()
-        )
-        
+        # Find mentions for the users in each dynasty
+        mentions_by_dynasty = {}
         for d, users in notifications.items():
-            # Find mentions for the users
             mentions = []
             for user_name in users:
-                # Find the user in the guild
-                for guild in self.bot.guilds:
-                    member = discord.utils.find(lambda m: user_name.upper() in m.name.upper(), guild.members)
-                    if member:
-                        mentions.append(member.mention)
-                        break
-            
-            if mentions:
-                embed.add_field(
-                    name=f"{d}",
-                    value=f"Waiting for: {', '.join(mentions)}",
-                    inline=False
-                )
+                # Look up the user in the bot's member index
+                member = self.bot.member_index.get(user_name.upper())
+                if member:
+                    mentions.append(member.mention)
+            mentions_by_dynasty[d] = mentions
+        
+        # Create a notification message
+        embed = create_reminder_embed(mentions_by_dynasty)
         
         await ctx.send(embed=embed)
     
@@ -219,8 +222,7 @@ class DynastyTracker(commands.Cog):
                 return
             
             # Reset the dynasty
-            for user in USERS:
-                self.storage.set_ready(user, dynasty, False)
+            self.storage.reset_dynasty(dynasty)
             
             embed = create_success_embed(
                 title=f"{dynasty} Reset",
@@ -228,9 +230,7 @@ class DynastyTracker(commands.Cog):
             )
         else:
             # Reset all dynasties
-            for d in DYNASTIES:
-                for user in USERS:
-                    self.storage.set_ready(user, d, False)
+            self.storage.reset_all()
             
             embed = create_success_embed(
                 title="All Dynasties Reset",
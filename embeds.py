@@ -4,6 +4,31 @@ Handles creation of various embed messages.
 """
 import discord
 
+# Colors shared by every embed, built once
+_BLUE = discord.Color.blue()
+_GREEN = discord.Color.green()
+_RED = discord.Color.red()
+_GOLD = discord.Color.gold()
+
+# Fixed parts of the status and reminder embeds
+_STATUS_TEMPLATE = {
+    "title": "Dynasty Advancement Status",
+    "description": "Current advancement status for each dynasty:",
+    "color": _BLUE.value
+}
+
+_REMINDER_TEMPLATE = {
+    "title": "Dynasty Advancement Reminder",
+    "description": "The following users still need to mark as ready:",
+    "color": _GOLD.value
+}
+
+_WEEKLY_REMINDER_TEMPLATE = {
+    "title": "Weekly Dynasty Advancement Reminder",
+    "description": "It's time to advance your dynasties! The following users still need to mark as ready:",
+    "color": _GOLD.value
+}
+
 def create_status_embed(storage, dynasties):
     """
     Create an embed showing the status of the specified dynasties.
@@ -15,12 +40,7 @@ def create_status_embed(storage, dynasties):
     Returns:
         discord.Embed: The formatted status embed
     """
-    embed = discord.Embed(
-        title="Dynasty Advancement Status",
-        description="Current advancement status for each dynasty:",
-        color=discord.Color.blue()
-    )
-    
+    fields = []
     for dynasty in dynasties:
         status = storage.get_dynasty_status(dynasty)
         
@@ -34,13 +54,13 @@ def create_status_embed(storage, dynasties):
             status_lines.append(f"{emoji} {user}")
         
         # Add the field for this dynasty
-        embed.add_field(
-            name=dynasty,
-            value="\n".join(status_lines) or "No users tracked",
-            inline=True
-        )
+        fields.append({
+            "name": dynasty,
+            "value": "\n".join(status_lines) or "No users tracked",
+            "inline": True
+        })
     
-    return embed
+    return discord.Embed.from_dict({**_STATUS_TEMPLATE, "fields": fields})
 
 def create_success_embed(title, description):
     """
@@ -56,7 +76,7 @@ def create_success_embed(title, description):
     return discord.Embed(
         title=title,
         description=description,
-        color=discord.Color.green()
+        color=_GREEN
     )
 
 def create_error_embed(title, description):
@@ -73,31 +93,37 @@ def create_error_embed(title, description):
     return discord.Embed(
         title=title,
         description=description,
-        color=discord.Color.red()
+        color=_RED
     )
 
-def create_reminder_embed(not_ready_users):
+def _waiting_fields(mentions_by_dynasty):
+    """Build the 'Waiting for' fields for dynasties that have users to mention."""
+    return [
+        {"name": dynasty, "value": f"Waiting for: {', '.join(mentions)}", "inline": False}
+        for dynasty, mentions in mentions_by_dynasty.items()
+        if mentions
+    ]
+
+def create_reminder_embed(mentions_by_dynasty):
     """
     Create a reminder embed for users who are not ready.
     
     Args:
-        not_ready_users: Dictionary mapping dynasties to lists of users who aren't ready
+        mentions_by_dynasty: Dictionary mapping dynasties to mentions of users who aren't ready
     
     Returns:
         discord.Embed: The formatted reminder embed
     """
-    embed = discord.Embed(
-        title="Dynasty Advancement Reminder",
-        description="The following users still need to mark as ready:",
-        color=discord.Color.gold()
-    )
+    return discord.Embed.from_dict({**_REMINDER_TEMPLATE, "fields": _waiting_fields(mentions_by_dynasty)})
+
+def create_weekly_reminder_embed(mentions_by_dynasty):
+    """
+    Create the weekly reminder embed for users who are not ready.
     
-    for dynasty, users in not_ready_users.items():
-        if users:
-            embed.add_field(
-                name=dynasty,
-                value=", ".join(users),
-                inline=False
-            )
+    Args:
+        mentions_by_dynasty: Dictionary mapping dynasties to mentions of users who aren't ready
     
-    return embed
+    Returns:
+        discord.Embed: The formatted weekly reminder embed
+    """
+    return discord.Embed.from_dict({**_WEEKLY_REMINDER_TEMPLATE, "fields": _waiting_fields(mentions_by_dynasty)})
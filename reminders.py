@@ -4,47 +4,77 @@ This module handles scheduled reminders for users who haven't
 marked their dynasties as ready.
 """
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 import logging
 import datetime
-import pytz
+from zoneinfo import ZoneInfo
 import asyncio
 
 from config import DYNASTIES, USERS, TIMEZONE, REMINDER_DAY, REMINDER_HOUR, REMINDER_MINUTE
-from utils.storage import DynastyStorage
-from utils.embeds import create_status_embed
+from utils.embeds import create_status_embed, create_weekly_reminder_embed
 
 logger = logging.getLogger('dynasty_bot.reminders')
 
+# Resolve the reminder time zone once
+_TZ = ZoneInfo(TIMEZONE)
+
 class Reminders(commands.Cog):
     """
     A cog for sending scheduled reminders about dynasty advancement.
     """
     def __init__(self, bot):
         self.bot = bot
-        self.storage = DynastyStorage()
-        self.reminder_task.start()
+        self.storage = bot.storage
+        self._reminder_task = None
+        # Maps guild IDs to the channel ID that last accepted a reminder
+        self._reminder_channels = {}
+    
+    async def cog_load(self):
+        """Start the reminder task when the cog is loaded."""
+        self._reminder_task = self.bot.loop.create_task(self.reminder_task())
     
     def cog_unload(self):
         """Stop the reminder task when the cog is unloaded."""
-        self.reminder_task.cancel()
+        if self._reminder_task is not None:
+            self._reminder_task.cancel()
     
-    @tasks.loop(hours=1)
     async def reminder_task(self):
-        """Check if reminders need to be sent every hour."""
-        # Get the current time in the specified timezone
-        tz = pytz.timezone(TIMEZONE)
-        now = datetime.datetime.now(tz)
+        """Sleep until the next weekly reminder time, send reminders, and repeat."""
+        # Wait until the bot is ready before scheduling anything
+        await self.bot.wait_until_ready()
         
-        # Check if it's time to send reminders (Saturday at 9:00 AM Central)
-        if now.weekday() == REMINDER_DAY and now.hour == REMINDER_HOUR and now.minute < 60:
+        after = datetime.datetime.now(_TZ)
+        while True:
+            target = self._next_reminder_after(after)
+            # Compare timestamps so a DST change between now and the target is accounted for
+            delay = max(0.0, target.timestamp() - datetime.datetime.now(_TZ).timestamp())
+            logger.info(f"Next weekly reminder in {delay / 3600:.1f} hours")
+            await asyncio.sleep(delay)
+            
             logger.info("Sending weekly reminders")
-            await self.send_reminders()
+            try:
+                await self.send_reminders()
+            except Exception as e:
+                logger.error(f"Error sending weekly reminders: {e}")
+            
+            # Schedule strictly after this target so an early wake-up can't pick it again
+            after = target + datetime.timedelta(minutes=1)
     
-    @reminder_task.before_loop
-    async def before_reminder_task(self):
-        """Wait until the bot is ready before starting the task."""
-        await self.bot.wait_until_ready()
+    @staticmethod
+    def _next_reminder_after(after):
+        """Return the first reminder time (Saturday at 9:00 AM Central) at or after the given time."""
+        reminder_time = datetime.time(REMINDER_HOUR, REMINDER_MINUTE)
+        
+        days_ahead = (REMINDER_DAY - after.weekday()) % 7
+        target_date = after.date() + datetime.timedelta(days=days_ahead)
+        target = datetime.datetime.combine(target_date, reminder_time, tzinfo=_TZ)
+        
+        # Already past this week's reminder time, so move on to next week
+        if target < after:
+            target_date += datetime.timedelta(days=7)
+            target = datetime.datetime.combine(target_date, reminder_time, tzinfo=_TZ)
+        
+        return target
     
     async def send_reminders(self):
         """Send reminder messages to users who haven't marked as ready."""
@@ -59,41 +89,50 @@ class Reminders(commands.Cog):
             # Everyone is ready, no need to send reminders
             return
         
-        # Create reminder embed
-        embed = discord.Embed(
-            title="Weekly Dynasty Advancement Reminder",
-            description="It's time to advance your dynasties! The following users still need to mark as ready:",
-            color=discord.Color.gold()
-        )
-        
+        # Find mentions for each user
+        mentions_by_dynasty = {}
         for dynasty, users in not_ready_users.items():
-            # Find mentions for each user
             mentions = []
             for user_name in users:
-                for guild in self.bot.guilds:
-                    member = discord.utils.find(lambda m: m.name == user_name, guild.members)
-                    if member:
-                        mentions.append(member.mention)
-                        break
-            
-            if mentions:
-                embed.add_field(
-                    name=f"{dynasty}",
-                    value=f"Waiting for: {', '.join(mentions)}",
-                    inline=False
-                )
+                member = self.bot.member_index.get(user_name.upper())
+                if member:
+                    mentions.append(member.mention)
+            mentions_by_dynasty[dynasty] = mentions
+        
+        # Create reminder embed
+        embed = create_weekly_reminder_embed(mentions_by_dynasty)
+        
+        # Send the reminder to one channel in every guild at the same time
+        guilds = list(self.bot.guilds)
+        results = await asyncio.gather(
+            *(self._send_to_first_channel(guild, embed) for guild in guilds),
+            return_exceptions=True
+        )
+        
+        for guild, result in zip(guilds, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending reminder to guild {guild.name}: {result}")
+    
+    async def _send_to_first_channel(self, guild, embed):
+        """Send the embed to the first channel in the guild that accepts it."""
+        # Try the remembered channel first, then the system channel, then the rest
+        candidates = []
+        cached = guild.get_channel(self._reminder_channels.get(guild.id, 0))
+        if cached:
+            candidates.append(cached)
+        if guild.system_channel and guild.system_channel not in candidates:
+            candidates.append(guild.system_channel)
+        candidates.extend(c for c in guild.text_channels if c not in candidates)
         
-        # Send reminder to all channels in all guilds
-        for guild in self.bot.guilds:
-            for channel in guild.text_channels:
-                try:
-                    await channel.send(embed=embed)
-                    # Only send to one channel per guild
-                    break
-                except discord.Forbidden:
-                    continue
-                except Exception as e:
-                    logger.error(f"Error sending reminder to {channel.name}: {e}")
+        for channel in candidates:
+            try:
+                await channel.send(embed=embed)
+                self._reminder_channels[guild.id] = channel.id
+                return
+            except discord.Forbidden:
+                continue
+            except Exception as e:
+                logger.error(f"Error sending reminder to {channel.name}: {e}")
 
 async def setup(bot):
     """Add the cog to the bot."""
@@ -3,9 +3,9 @@ Storage utilities for the Dynasty Tracker Discord Bot.
 Handles persistence of dynasty advancement status.
 """
 import os
-import json
+import orjson
+import asyncio
 import logging
-import threading
 from threading import Lock
 
 from config import DYNASTIES, USERS, DATA_PATH
@@ -18,12 +18,15 @@ class DynastyStorage:
     """
     _instance = None
     _initialized = False
+    _instance_lock = Lock()
     _lock = Lock()
     
     def __new__(cls):
         """Implement singleton pattern."""
         if cls._instance is None:
-            cls._instance = super(DynastyStorage, cls).__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super(DynastyStorage, cls).__new__(cls)
         return cls._instance
     
     def __init__(self):
@@ -32,8 +35,20 @@ class DynastyStorage:
         if DynastyStorage._initialized:
             return
         
+        with DynastyStorage._instance_lock:
+            if DynastyStorage._initialized:
+                return
+            self._initialize()
+            DynastyStorage._initialized = True
+    
+    def _initialize(self):
+        """Set up the data structure and load data from disk."""
         self.data_path = DATA_PATH
         self.data = {}
+        self._dirty = None
+        self._pending_save = False
+        self._writer_task = None
+        self._last_saved = None
         
         # Initialize the data structure if it doesn't exist
         if not os.path.exists(os.path.dirname(self.data_path)):
@@ -41,39 +56,55 @@ class DynastyStorage:
         
         # Load data from file or create default data
         self._load_data()
-        
-        DynastyStorage._initialized = True
     
     def _load_data(self):
         """Load data from the JSON file or create default data."""
         try:
             if os.path.exists(self.data_path):
-                with open(self.data_path, 'r') as f:
-                    self.data = json.load(f)
-                logger.info(f"Loaded data from {self.data_path}")
+                with open(self.data_path, 'rb') as f:
+                    self.data = orjson.loads(f.read())
+                logger.info("Loaded data from %s", self.data_path)
             else:
                 self._create_default_data()
                 self._save_data()
-                logger.info(f"Created default data at {self.data_path}")
+                logger.info("Created default data at %s", self.data_path)
         except Exception as e:
-            logger.error(f"Error loading data: {e}")
+            logger.error("Error loading data: %s", e)
             self._create_default_data()
             self._save_data()
     
     def _create_default_data(self):
         """Create default data structure."""
-        self.data = {}
-        for dynasty in DYNASTIES:
-            self.data[dynasty] = {}
-            for user in USERS:
-                self.data[dynasty][user] = False
+        self.data = {dynasty: dict.fromkeys(USERS, False) for dynasty in DYNASTIES}
     
     def _save_data(self):
-        """Save data to the JSON file via background thread."""
-        # Use the background method to avoid blocking the main thread
-        save_thread = threading.Thread(target=self._save_data_background)
-        save_thread.daemon = True
-        save_thread.start()
+        """Schedule a save of the data; bursts are coalesced into one write."""
+        if self._dirty is None:
+            # The writer hasn't started yet; it saves pending changes when it does
+            self._pending_save = True
+            return
+        self._dirty.set()
+    
+    def start_writer(self, loop):
+        """Start the background writer task on the given event loop."""
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = loop.create_task(self._writer())
+    
+    async def _writer(self):
+        """Wait for pending changes and write them to disk off the event loop."""
+        loop = asyncio.get_running_loop()
+        
+        # Create the event on the running loop and flush changes made before startup
+        if self._dirty is None:
+            self._dirty = asyncio.Event()
+        if self._pending_save:
+            self._pending_save = False
+            self._dirty.set()
+        
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            await loop.run_in_executor(None, self._write_snapshot)
     
     def is_ready(self, user, dynasty):
         """Check if a user is ready for a specific dynasty."""
@@ -81,11 +112,11 @@ class DynastyStorage:
         
         # Ensure the dynasty and user exist in the data
         if dynasty not in self.data:
-            logger.error(f"Dynasty {dynasty} not found in data")
+            logger.error("Dynasty %s not found in data", dynasty)
             return False
         
         if user not in self.data[dynasty]:
-            logger.error(f"User {user} not found in dynasty {dynasty} data")
+            logger.error("User %s not found in dynasty %s data", user, dynasty)
             return False
         
         return self.data[dynasty][user]
@@ -96,42 +127,94 @@ class DynastyStorage:
         
         # Ensure the dynasty and user exist in the data
         if dynasty not in self.data:
-            logger.error(f"Dynasty {dynasty} not found in data")
+            logger.error("Dynasty %s not found in data", dynasty)
             return False
         
         if user not in self.data[dynasty]:
-            logger.error(f"User {user} not found in dynasty {dynasty} data")
+            logger.error("User %s not found in dynasty %s data", user, dynasty)
             return False
         
         # Update the ready status in memory (don't block to save)
         with self._lock:
+            if self.data[dynasty][user] == ready:
+                # Nothing changed, so there is nothing to save
+                return True
             self.data[dynasty][user] = ready
         
-        # Save via the _save_data method which is already non-blocking
+        # Mark the data dirty; the writer task handles the actual save
         self._save_data()
         
         return True
         
-    def _save_data_background(self):
-        """Save data to the JSON file in a background thread."""
+    def reset_dynasty(self, dynasty):
+        """Mark every user as not ready for a specific dynasty."""
+        dynasty = dynasty.upper()
+        
+        if dynasty not in self.data:
+            logger.error("Dynasty %s not found in data", dynasty)
+            return False
+        
+        with self._lock:
+            if not any(self.data[dynasty].values()):
+                return True
+            for user in self.data[dynasty]:
+                self.data[dynasty][user] = False
+        
+        self._save_data()
+        
+        return True
+    
+    def reset_all(self):
+        """Mark every user as not ready for all dynasties."""
+        with self._lock:
+            if not any(any(users.values()) for users in self.data.values()):
+                return True
+            for users in self.data.values():
+                for user in users:
+                    users[user] = False
+        
+        self._save_data()
+        
+        return True
+    
+    def _write_snapshot(self):
+        """Write a snapshot of the data to the JSON file atomically."""
         try:
             with self._lock:
-                data_copy = self.data.copy()
-                
-            # Save the data outside the lock to avoid blocking
-            with open(self.data_path, 'w') as f:
-                json.dump(data_copy, f, indent=4)
-                
-            logger.debug(f"Saved data to {self.data_path}")
+                data_copy = {dynasty: users.copy() for dynasty, users in self.data.items()}
+            
+            # Skip the write if the data matches what was last written
+            payload = orjson.dumps(data_copy, option=orjson.OPT_INDENT_2)
+            if payload == self._last_saved:
+                return
+            
+            # Write to a temporary file and swap it in so a crash never leaves a partial file
+            tmp_path = self.data_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.data_path)
+            self._last_saved = payload
+            
+            logger.debug("Saved data to %s", self.data_path)
         except Exception as e:
-            logger.error(f"Error saving data: {e}")
+            logger.error("Error saving data: %s", e)
+    
+    def all_ready(self, dynasty):
+        """Check if every tracked user is ready for a specific dynasty."""
+        dynasty = dynasty.upper()
+        
+        if dynasty not in self.data:
+            logger.error("Dynasty %s not found in data", dynasty)
+            return False
+        
+        return all(self.data[dynasty].get(user, False) for user in USERS)
     
     def get_dynasty_status(self, dynasty):
         """Get the ready status for all users in a specific dynasty."""
         dynasty = dynasty.upper()
         
         if dynasty not in self.data:
-            logger.error(f"Dynasty {dynasty} not found in data")
+            logger.error("Dynasty %s not found in data", dynasty)
             return {}
         
         return self.data[dynasty].copy()